@@ -10,18 +10,51 @@ Scans source code for potential PII handling issues:
 - Incomplete deletion
 
 Usage:
-    python privacy-scan.py [path] [--output json|text] [--severity critical|high|medium|low]
+    python privacy-scan.py [path] [--output json|text] [--severity critical|high|medium|low] [--jobs N]
+
+Optional compiled build (pip install mypy); it is never used by this script,
+so run it explicitly, and rebuild it after editing this file:
+    cd scripts && cp privacy-scan.py privacy_scan_c.py && mypyc privacy_scan_c.py
+    python -c "import privacy_scan_c; privacy_scan_c.main()" [path] [options]
 """
 
+from __future__ import annotations
+
 import argparse
+import codecs
+import functools
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Generator, List
+from typing import Any, Deque, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+# RE2 matches in linear time without backtracking and is used for the
+# patterns when installed (pip install google-re2)
+try:
+    import re2  # type: ignore
+except ImportError:
+    re2 = re
+
+# Hyperscan compiles all the patterns into one SIMD automaton and replaces
+# the regexes when installed (pip install hyperscan)
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None  # type: ignore
+
+# orjson writes the JSON report much faster than the json module and
+# serialises Finding directly when installed (pip install orjson)
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
 
 
 class Severity(Enum):
@@ -31,7 +64,17 @@ class Severity(Enum):
     LOW = "low"
 
 
-@dataclass
+# Severity values ranked most severe first, for filtering and sorting
+SEVERITY_RANK = {severity.value: rank for rank, severity in enumerate(Severity)}
+
+
+# Findings are slotted where dataclass(slots=True) is available (Python
+# 3.10+). Explicit __slots__ would break the mypyc build, whose compiled
+# classes never have a per-instance __dict__ anyway.
+FINDING_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**FINDING_OPTIONS)
 class Finding:
     file: str
     line: int
@@ -42,40 +85,83 @@ class Finding:
     recommendation: str
 
 
-# PII field patterns
+# PII field keywords, matched as whole words
 PII_FIELD_PATTERNS = [
-    (r'\b(ssn|social_security|social_security_number)\b', 'SSN', Severity.CRITICAL),
-    (r'\b(credit_card|card_number|cc_number|ccn)\b', 'Credit Card', Severity.CRITICAL),
-    (r'\b(password|passwd|pwd|secret|api_key|apikey|token)\b', 'Credential', Severity.CRITICAL),
-    (r'\b(passport|passport_number|passport_no)\b', 'Passport', Severity.CRITICAL),
-    (r'\b(driver_license|drivers_license|dl_number)\b', 'Driver License', Severity.CRITICAL),
-    (r'\b(bank_account|account_number|routing_number|iban)\b', 'Financial', Severity.CRITICAL),
-    (r'\b(email|email_address|e_mail)\b', 'Email', Severity.HIGH),
-    (r'\b(phone|phone_number|mobile|telephone|cell)\b', 'Phone', Severity.HIGH),
-    (r'\b(address|street_address|home_address|mailing_address)\b', 'Address', Severity.HIGH),
-    (r'\b(birth_date|dob|date_of_birth|birthday)\b', 'Birth Date', Severity.HIGH),
-    (r'\b(first_name|last_name|full_name|surname|given_name)\b', 'Name', Severity.MEDIUM),
-    (r'\b(ip_address|ip_addr|client_ip|user_ip)\b', 'IP Address', Severity.MEDIUM),
-    (r'\b(location|latitude|longitude|geo_location|coordinates)\b', 'Location', Severity.MEDIUM),
-    (r'\b(gender|sex|ethnicity|race|religion)\b', 'Demographic', Severity.MEDIUM),
-    (r'\b(medical|health|diagnosis|prescription|condition)\b', 'Health', Severity.CRITICAL),
-    (r'\b(biometric|fingerprint|face_id|facial|retina)\b', 'Biometric', Severity.CRITICAL),
+    (r'ssn|social_security|social_security_number', 'SSN', Severity.CRITICAL),
+    (r'credit_card|card_number|cc_number|ccn', 'Credit Card', Severity.CRITICAL),
+    (r'password|passwd|pwd|secret|api_key|apikey|token', 'Credential', Severity.CRITICAL),
+    (r'passport|passport_number|passport_no', 'Passport', Severity.CRITICAL),
+    (r'driver_license|drivers_license|dl_number', 'Driver License', Severity.CRITICAL),
+    (r'bank_account|account_number|routing_number|iban', 'Financial', Severity.CRITICAL),
+    (r'email|email_address|e_mail', 'Email', Severity.HIGH),
+    (r'phone|phone_number|mobile|telephone|cell', 'Phone', Severity.HIGH),
+    (r'address|street_address|home_address|mailing_address', 'Address', Severity.HIGH),
+    (r'birth_date|dob|date_of_birth|birthday', 'Birth Date', Severity.HIGH),
+    (r'first_name|last_name|full_name|surname|given_name', 'Name', Severity.MEDIUM),
+    (r'ip_address|ip_addr|client_ip|user_ip', 'IP Address', Severity.MEDIUM),
+    (r'location|latitude|longitude|geo_location|coordinates', 'Location', Severity.MEDIUM),
+    (r'gender|sex|ethnicity|race|religion', 'Demographic', Severity.MEDIUM),
+    (r'medical|health|diagnosis|prescription|condition', 'Health', Severity.CRITICAL),
+    (r'biometric|fingerprint|face_id|facial|retina', 'Biometric', Severity.CRITICAL),
 ]
 
-# PII in logs pattern
+# PII in logs: logging calls whose arguments mention a PII keyword
 LOG_PATTERNS = [
-    r'(console\.(log|info|warn|error|debug))\s*\([^)]*\b(email|phone|ssn|password|credit_card|address)',
-    r'(logger\.(log|info|warn|error|debug))\s*\([^)]*\b(email|phone|ssn|password|credit_card|address)',
-    r'(log\.(info|warn|error|debug))\s*\([^)]*\b(email|phone|ssn|password|credit_card|address)',
-    r'(print|println|printf)\s*\([^)]*\b(email|phone|ssn|password|credit_card|address)',
-    r'(logging\.(info|warn|error|debug))\s*\([^)]*\b(email|phone|ssn|password|credit_card|address)',
+    r'console\.(log|info|warn|error|debug)',
+    r'logger\.(log|info|warn|error|debug)',
+    r'log\.(info|warn|error|debug)',
+    r'(print|println|printf)',
+    r'logging\.(info|warn|error|debug)',
 ]
-
-# Unencrypted storage patterns
-UNENCRYPTED_PATTERNS = [
-    r'(\w+)\s*=\s*(request|req)\.(body|form|params|query)\s*\[\s*[\'"]?(ssn|password|credit_card|card_number)',
-    r'(db|database|store|save)\s*\.\s*\w+\s*\([^)]*\b(ssn|password|credit_card)\b[^)]*\)\s*(?!.*encrypt)',
+LOG_ARGUMENT_PATTERN = r'[^\S\n]*\([^)\n]*\b(email|phone|ssn|password|credit_card|address)'
+
+# Unencrypted storage: request fields with sensitive data assigned straight
+# to a variable, and storage calls passing sensitive data unless the rest of
+# the line mentions encryption
+REQUEST_FIELD_PATTERN = r'\b(\w+)[^\S\n]*=[^\S\n]*(request|req)\.(body|form|params|query)[^\S\n]*\[[^\S\n]*[\'"]?(ssn|password|credit_card|card_number)'
+STORAGE_CALL_PATTERN = r'(db|database|store|save)[^\S\n]*\.[^\S\n]*\w+[^\S\n]*\([^)\n]*\b(ssn|password|credit_card)\b[^)\n]*\)'
+
+# Literal keywords that every log or unencrypted storage match must contain;
+# files with none of them skip those patterns entirely
+LOG_KEYWORDS = (b'email', b'phone', b'ssn', b'password', b'credit_card', b'address')
+UNENCRYPTED_KEYWORDS = (b'ssn', b'password', b'credit_card', b'card_number')
+
+# The PII field and log patterns are each fused into a single regex so a file
+# is matched in one pass, with the parts the patterns share factored out of
+# the alternation. Files are scanned whole as bytes, so patterns must not match across a
+# newline (hence [^\S\n] and [^)\n] rather than \s and [^)]).
+# PII fields get a named group per pattern; the group that matched indexes
+# back into PII_META.
+PII_FIELDS_RE = re2.compile((r'\b(?:%s)\b' % '|'.join(
+    f'(?P<g{i}>{keywords})' for i, (keywords, _, _) in enumerate(PII_FIELD_PATTERNS)
+)).encode())
+PII_META = [
+    (
+        severity.value,
+        f'Potential {pii_type} field detected',
+        f'Ensure {pii_type} data is encrypted and access is logged',
+    )
+    for _, pii_type, severity in PII_FIELD_PATTERNS
 ]
+LOG_RE = re2.compile(('(?:%s)%s' % ('|'.join(LOG_PATTERNS), LOG_ARGUMENT_PATTERN)).encode())
+REQUEST_FIELD_RE = re2.compile(REQUEST_FIELD_PATTERN.encode())
+STORAGE_CALL_RE = re2.compile(STORAGE_CALL_PATTERN.encode())
+
+# Files are matched as lowercased ASCII bytes. Bytes-mode \w, \b and \s only
+# know ASCII, so each non-ASCII character is replaced by as many stand-in
+# bytes as it takes in UTF-8, chosen to keep its str-mode class: '0' for word
+# characters (no pattern contains a digit), ' ' for whitespace and '$' for
+# anything else, including undecodable bytes. Offsets still line up with the
+# original file. \x1c-\x1f are whitespace to str.isspace() as well.
+MATCH_TABLE = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ\x1c\x1d\x1e\x1f', b'abcdefghijklmnopqrstuvwxyz    '
+)
+NON_ASCII_RE = re.compile('[^\x00-\x7f]+')
+
+# Hyperscan pattern ids: the PII field patterns first (matching their
+# PII_META index), then the log, request field and storage call patterns
+LOG_PATTERN_ID = len(PII_FIELD_PATTERNS)
+REQUEST_FIELD_PATTERN_ID = LOG_PATTERN_ID + 1
 
 # File extensions to scan
 SCAN_EXTENSIONS = {
@@ -83,124 +169,349 @@ SCAN_EXTENSIONS = {
     '.swift', '.kt', '.scala', '.rs', '.cpp', '.c', '.h'
 }
 
+# Lines starting with these are treated as comments and not reported
+COMMENT_PREFIXES = (b'//', b'#', b'*')
+COMMENT_TEXT_PREFIXES = tuple(prefix.decode() for prefix in COMMENT_PREFIXES)
+
+# First byte of a line's text: anything str.strip() keeps among ASCII bytes
+LINE_TEXT_RE = re.compile(rb'[^\t\n\x0b\x0c\r\x1c-\x1f ]')
+
+# Snippets are the first SNIPPET_LENGTH characters of a line's text; UTF-8
+# needs at most 4 bytes per character, so only that much is decoded
+SNIPPET_LENGTH = 100
+SNIPPET_BYTES = SNIPPET_LENGTH * 4
+
 # Directories to skip
 SKIP_DIRS = {
     'node_modules', 'vendor', 'venv', '.venv', '__pycache__', 
     'dist', 'build', '.git', '.svn', 'target', 'bin', 'obj'
 }
 
+# Larger files (bundles, generated code) are skipped with a warning, and
+# files with a NUL byte in their first bytes are treated as binary
+MAX_FILE_SIZE = 2_000_000
+BINARY_SNIFF_SIZE = 512
+
+# Reader threads and how many files they may read ahead of the serial scan
+READ_AHEAD_THREADS = 8
+READ_AHEAD_DEPTH = 32
+
 
 def should_scan_file(path: Path) -> bool:
     """Check if file should be scanned."""
-    if path.suffix.lower() not in SCAN_EXTENSIONS:
-        return False
-    
-    for part in path.parts:
-        if part in SKIP_DIRS:
-            return False
-    
-    return True
+    return path.suffix.lower() in SCAN_EXTENSIONS
 
 
 def get_files(path: str) -> Generator[Path, None, None]:
     """Get all scannable files in path."""
     root = Path(path)
     
+    # Skipped directories are pruned while walking, so only the root itself
+    # needs checking here
+    if any(part in SKIP_DIRS for part in root.parts):
+        return
+    
     if root.is_file():
         if should_scan_file(root):
             yield root
         return
     
-    for file_path in root.rglob('*'):
-        if file_path.is_file() and should_scan_file(file_path):
-            yield file_path
+    # Walk with scandir so directory entries come with their type, and never
+    # descend into skipped directories
+    stack = ['' if str(root) == '.' else str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    entry_path = os.path.join(directory, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry_path)
+                    elif entry.is_file():
+                        if os.path.splitext(entry.name)[1].lower() in SCAN_EXTENSIONS:
+                            yield Path(entry_path)
+        except OSError:
+            continue
 
 
-def scan_file(file_path: Path) -> List[Finding]:
-    """Scan a single file for PII issues."""
-    findings = []
+def build_hyperscan_database() -> Optional['hyperscan.Database']:
+    """Compile every pattern into one Hyperscan database."""
+    if hyperscan is None:
+        return None
+    
+    expressions = [f'\\b(?:{keywords})\\b'.encode() for keywords, _, _ in PII_FIELD_PATTERNS]
+    expressions += [LOG_RE.pattern, REQUEST_FIELD_RE.pattern, STORAGE_CALL_RE.pattern]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+    )
+    return database
+
+
+HYPERSCAN_DB = build_hyperscan_database()
+
+
+def match_patterns(
+    content_lower: bytes,
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, None]], List[Tuple[int, None]]]:
+    """Find PII field, log and unencrypted storage matches as (offset, value) lists.
+    
+    PII field values are PII_META indexes; the others are None.
+    """
+    if HYPERSCAN_DB is None:
+        pii_matches = [(m.start(), int(m.lastgroup[1:])) for m in PII_FIELDS_RE.finditer(content_lower)]
+        log_matches: List[Tuple[int, None]] = []
+        unencrypted_matches: List[Tuple[int, None]] = []
+        storage_ends: List[int] = []
+        if any(keyword in content_lower for keyword in LOG_KEYWORDS):
+            log_matches = [(m.start(), None) for m in LOG_RE.finditer(content_lower)]
+        if any(keyword in content_lower for keyword in UNENCRYPTED_KEYWORDS):
+            unencrypted_matches = [(m.start(), None) for m in REQUEST_FIELD_RE.finditer(content_lower)]
+            storage_ends = [m.end() for m in STORAGE_CALL_RE.finditer(content_lower)]
+    else:
+        pii_matches = []
+        log_matches = []
+        unencrypted_matches = []
+        storage_ends = []
+        
+        # Matches are reported in order of end offset; no pattern matches a
+        # newline, so the last matched byte sits on the same line as the first
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+            if pattern_id < LOG_PATTERN_ID:
+                pii_matches.append((end - 1, pattern_id))
+            elif pattern_id == LOG_PATTERN_ID:
+                log_matches.append((end - 1, None))
+            elif pattern_id == REQUEST_FIELD_PATTERN_ID:
+                unencrypted_matches.append((end - 1, None))
+            else:  # storage call
+                storage_ends.append(end)
+        
+        HYPERSCAN_DB.scan(content_lower, match_event_handler=on_match)
+    
+    # A storage call always ends at the first ')' after its '(', so checking
+    # the rest of the line after each match end is equivalent to a
+    # (?!.*encrypt) lookahead, which RE2 and Hyperscan don't support
+    for end in storage_ends:
+        line_end = content_lower.find(b'\n', end)
+        if line_end == -1:
+            line_end = len(content_lower)
+        if content_lower.find(b'encrypt', end, line_end) == -1:
+            unencrypted_matches.append((end - 1, None))
+    unencrypted_matches.sort()
+    
+    return pii_matches, log_matches, unencrypted_matches
+
+
+# Match values: PII_META indexes for PII fields, None for the other checks
+T = TypeVar('T')
+
+
+def find_matches(
+    matches: Iterable[Tuple[int, T]], content: bytes
+) -> Iterator[Tuple[int, int, int, T]]:
+    """Yield (line number, text start, line end, value) for (offset, value) matches outside comments.
+    
+    The text start and line end are byte offsets for code_snippet(), so only
+    lines that are reported get decoded.
+    """
+    line_num = 1
+    line_start = 0
+    line_end = -1
+    text_start = 0
+    is_comment = False
+    
+    for offset, value in matches:
+        if offset > line_end:
+            line_num += content.count(b'\n', line_start, offset)
+            line_start = content.rfind(b'\n', 0, offset) + 1
+            line_end = content.find(b'\n', offset)
+            if line_end == -1:
+                line_end = len(content)
+            text = LINE_TEXT_RE.search(content, line_start, line_end)
+            text_start = text.start() if text else line_end
+            is_comment = content.startswith(COMMENT_PREFIXES, text_start)
+            if not is_comment and text_start < line_end and content[text_start] >= 0x80:
+                # Non-ASCII whitespace or invalid bytes can still lead a comment
+                snippet = code_snippet(content, text_start, line_end)
+                is_comment = snippet.startswith(COMMENT_TEXT_PREFIXES)
+        
+        if not is_comment:
+            yield line_num, text_start, line_end, value
+
+
+def code_snippet(content: bytes, start: int, end: int) -> str:
+    """Decode the first SNIPPET_LENGTH characters of the line text at content[start:end]."""
+    stop = start + SNIPPET_BYTES
+    if end <= stop:
+        return content[start:end].decode('utf-8', errors='ignore').strip()[:SNIPPET_LENGTH]
+    
+    snippet = content[start:stop].decode('utf-8', errors='ignore').strip()
+    if len(snippet) < SNIPPET_LENGTH:
+        # Invalid bytes or non-ASCII whitespace left the bounded slice short
+        snippet = content[start:end].decode('utf-8', errors='ignore').strip()
+    return snippet[:SNIPPET_LENGTH]
+
+
+@functools.lru_cache(maxsize=None)
+def ascii_stand_in(char: str) -> str:
+    """Return the stand-in text for one non-ASCII character (see MATCH_TABLE)."""
+    if 0xDC80 <= ord(char) <= 0xDCFF:  # an undecodable byte (surrogateescape)
+        return '$'
+    size = len(char.encode('utf-8'))
+    if char.isalnum():
+        return '0' * size
+    if char.isspace():
+        return ' ' * size
+    return '$' * size
+
+
+def match_text(content: bytes) -> bytes:
+    """Return the bytes the patterns are matched against, offset for offset with content."""
+    if content.isascii():
+        return content.translate(MATCH_TABLE)
     
+    text = content.decode('utf-8', errors='surrogateescape')
+    text = NON_ASCII_RE.sub(lambda m: ''.join(map(ascii_stand_in, m.group())), text)
+    return text.encode('ascii').translate(MATCH_TABLE)
+
+
+def read_file(file_path: Path) -> Optional[bytes]:
+    """Read a file's raw contents, or None if it cannot be read or is skipped."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        lines = content.split('\n')
+        with file_path.open('rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > MAX_FILE_SIZE:
+                print(f"Warning: Skipping {file_path}: {size} bytes is over the "
+                      f"{MAX_FILE_SIZE} byte limit", file=sys.stderr)
+                return None
+            content = f.read()
     except Exception as e:
         print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
-        return findings
+        return None
     
-    # Check for PII fields
-    for line_num, line in enumerate(lines, 1):
-        line_lower = line.lower()
-        
-        # Skip comments
-        stripped = line.strip()
-        if stripped.startswith('//') or stripped.startswith('#') or stripped.startswith('*'):
+    # A NUL byte near the start means a binary file with a source extension
+    if b'\0' in content[:BINARY_SNIFF_SIZE]:
+        return None
+    
+    return content
+
+
+def read_ahead(files: Iterable[Path]) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """Yield files with their contents, reading the next ones on threads."""
+    pending: Deque[Tuple[Path, Future[Optional[bytes]]]] = deque()
+    with ThreadPoolExecutor(READ_AHEAD_THREADS) as executor:
+        for file_path in files:
+            pending.append((file_path, executor.submit(read_file, file_path)))
+            if len(pending) > READ_AHEAD_DEPTH:
+                file_path, future = pending.popleft()
+                yield file_path, future.result()
+        while pending:
+            file_path, future = pending.popleft()
+            yield file_path, future.result()
+
+
+def scan_file(file_path: Path) -> List[Finding]:
+    """Scan a single file for PII issues."""
+    content = read_file(file_path)
+    if content is None:
+        return []
+    
+    return scan_content(str(file_path), content)
+
+
+def scan_content(file: str, content: bytes) -> List[Finding]:
+    """Scan the raw contents of a file for PII issues."""
+    findings = []
+    
+    # Translate line endings as universal newlines would, so CRLF and CR-only
+    # files number their lines and cut their snippets like LF files
+    if b'\r' in content:
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    # The patterns are lowercase: lowering the file once is cheaper than
+    # matching with re.IGNORECASE
+    content_lower = match_text(content)
+    pii_matches, log_matches, unencrypted_matches = match_patterns(content_lower)
+    
+    # Check PII field patterns; each line reports the first pattern it
+    # matches, in table order
+    matched: Dict[int, Tuple[int, int, int]] = {}
+    for line_num, text_start, line_end, index in find_matches(pii_matches, content):
+        if line_num not in matched or index < matched[line_num][2]:
+            matched[line_num] = (text_start, line_end, index)
+    
+    for line_num, (text_start, line_end, index) in matched.items():
+        severity, description, recommendation = PII_META[index]
+        findings.append(Finding(
+            file=file,
+            line=line_num,
+            severity=severity,
+            category='pii_field',
+            description=description,
+            code_snippet=code_snippet(content, text_start, line_end),
+            recommendation=recommendation
+        ))
+    
+    # Check for PII in logs
+    last_line = 0
+    for line_num, text_start, line_end, _ in find_matches(log_matches, content):
+        if line_num == last_line:
             continue
-        
-        # Check PII field patterns
-        for pattern, pii_type, severity in PII_FIELD_PATTERNS:
-            if re.search(pattern, line_lower):
-                findings.append(Finding(
-                    file=str(file_path),
-                    line=line_num,
-                    severity=severity.value,
-                    category='pii_field',
-                    description=f'Potential {pii_type} field detected',
-                    code_snippet=line.strip()[:100],
-                    recommendation=f'Ensure {pii_type} data is encrypted and access is logged'
-                ))
-        
-        # Check for PII in logs
-        for pattern in LOG_PATTERNS:
-            if re.search(pattern, line_lower):
-                findings.append(Finding(
-                    file=str(file_path),
-                    line=line_num,
-                    severity=Severity.HIGH.value,
-                    category='pii_in_logs',
-                    description='Potential PII being logged',
-                    code_snippet=line.strip()[:100],
-                    recommendation='Remove PII from log statements or use masking'
-                ))
-        
-        # Check for unencrypted storage
-        for pattern in UNENCRYPTED_PATTERNS:
-            if re.search(pattern, line_lower):
-                findings.append(Finding(
-                    file=str(file_path),
-                    line=line_num,
-                    severity=Severity.CRITICAL.value,
-                    category='unencrypted_pii',
-                    description='Potential unencrypted PII storage',
-                    code_snippet=line.strip()[:100],
-                    recommendation='Encrypt sensitive data before storage'
-                ))
+        last_line = line_num
+        findings.append(Finding(
+            file=file,
+            line=line_num,
+            severity=Severity.HIGH.value,
+            category='pii_in_logs',
+            description='Potential PII being logged',
+            code_snippet=code_snippet(content, text_start, line_end),
+            recommendation='Remove PII from log statements or use masking'
+        ))
+    
+    # Check for unencrypted storage
+    last_line = 0
+    for line_num, text_start, line_end, _ in find_matches(unencrypted_matches, content):
+        if line_num == last_line:
+            continue
+        last_line = line_num
+        findings.append(Finding(
+            file=file,
+            line=line_num,
+            severity=Severity.CRITICAL.value,
+            category='unencrypted_pii',
+            description='Potential unencrypted PII storage',
+            code_snippet=code_snippet(content, text_start, line_end),
+            recommendation='Encrypt sensitive data before storage'
+        ))
     
     return findings
 
 
-def deduplicate_findings(findings: List[Finding]) -> List[Finding]:
-    """Remove duplicate findings."""
-    seen = set()
-    unique = []
+def filter_by_severity(findings: List[Finding], min_severity: str) -> Tuple[List[Finding], Dict[str, int]]:
+    """Filter findings by minimum severity, counting the kept ones per severity."""
+    max_rank = SEVERITY_RANK[min_severity.lower()]
+    counts = dict.fromkeys(SEVERITY_RANK, 0)
     
+    kept = []
     for f in findings:
-        key = (f.file, f.line, f.category)
-        if key not in seen:
-            seen.add(key)
-            unique.append(f)
-    
-    return unique
+        if SEVERITY_RANK[f.severity] <= max_rank:
+            kept.append(f)
+            counts[f.severity] += 1
+    return kept, counts
 
 
-def filter_by_severity(findings: List[Finding], min_severity: str) -> List[Finding]:
-    """Filter findings by minimum severity."""
-    severity_order = ['critical', 'high', 'medium', 'low']
-    min_index = severity_order.index(min_severity.lower())
-    
-    return [f for f in findings if severity_order.index(f.severity) <= min_index]
+def count_by_severity(findings: List[Finding]) -> Dict[str, int]:
+    """Count findings per severity in a single pass."""
+    counts = dict.fromkeys(SEVERITY_RANK, 0)
+    for f in findings:
+        counts[f.severity] += 1
+    return counts
 
 
-def format_text_report(findings: List[Finding]) -> str:
+def format_text_report(findings: List[Finding], counts: Optional[Dict[str, int]] = None) -> str:
     """Format findings as text report."""
     if not findings:
         return "✅ No privacy issues found."
@@ -213,19 +524,16 @@ def format_text_report(findings: List[Finding]) -> str:
     ]
     
     # Summary
-    by_severity = {}
-    for f in findings:
-        by_severity[f.severity] = by_severity.get(f.severity, 0) + 1
+    by_severity = counts if counts is not None else count_by_severity(findings)
     
     lines.append("Summary:")
-    for sev in ['critical', 'high', 'medium', 'low']:
-        count = by_severity.get(sev, 0)
+    for sev, count in by_severity.items():
         if count > 0:
             lines.append(f"  {sev.upper()}: {count}")
     lines.append("")
     
     # Findings by file
-    by_file = {}
+    by_file: Dict[str, List[Finding]] = {}
     for f in findings:
         by_file.setdefault(f.file, []).append(f)
     
@@ -239,10 +547,7 @@ def format_text_report(findings: List[Finding]) -> str:
         lines.append("")
     
     # Final status
-    critical_count = by_severity.get('critical', 0)
-    high_count = by_severity.get('high', 0)
-    
-    if critical_count > 0 or high_count > 0:
+    if by_severity['critical'] > 0 or by_severity['high'] > 0:
         lines.append("❌ PRIVACY SCAN FAILED - Critical/High issues found")
     else:
         lines.append("⚠️ PRIVACY SCAN PASSED WITH WARNINGS")
@@ -250,50 +555,84 @@ def format_text_report(findings: List[Finding]) -> str:
     return '\n'.join(lines)
 
 
-def format_json_report(findings: List[Finding]) -> str:
+def stdout_is_utf8() -> bool:
+    """Check whether stdout encodes text as UTF-8."""
+    try:
+        return codecs.lookup(sys.stdout.encoding or 'ascii').name == 'utf-8'
+    except (AttributeError, LookupError):
+        return False
+
+
+def format_json_report(findings: List[Finding], counts: Optional[Dict[str, int]] = None) -> str:
     """Format findings as JSON."""
+    if counts is None:
+        counts = count_by_severity(findings)
     report = {
-        'summary': {
-            'total': len(findings),
-            'critical': sum(1 for f in findings if f.severity == 'critical'),
-            'high': sum(1 for f in findings if f.severity == 'high'),
-            'medium': sum(1 for f in findings if f.severity == 'medium'),
-            'low': sum(1 for f in findings if f.severity == 'low'),
-        },
-        'passed': all(f.severity not in ('critical', 'high') for f in findings),
-        'findings': [asdict(f) for f in findings]
+        'summary': {'total': len(findings), **counts},
+        'passed': counts['critical'] == 0 and counts['high'] == 0,
+        'findings': findings,
     }
+    # orjson writes non-ASCII characters raw where json escapes them, so it
+    # is only used when stdout can encode them (not e.g. cp1252 redirects)
+    if orjson is not None and stdout_is_utf8():
+        try:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # e.g. surrogate-escaped file names, which only json can escape
+            pass
+    
+    report['findings'] = [
+        {
+            'file': f.file,
+            'line': f.line,
+            'severity': f.severity,
+            'category': f.category,
+            'description': f.description,
+            'code_snippet': f.code_snippet,
+            'recommendation': f.recommendation,
+        }
+        for f in findings
+    ]
     return json.dumps(report, indent=2)
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(description='Scan code for privacy/PII issues')
     parser.add_argument('path', nargs='?', default='.', help='Path to scan')
     parser.add_argument('--output', '-o', choices=['text', 'json'], default='text',
                        help='Output format')
     parser.add_argument('--severity', '-s', choices=['critical', 'high', 'medium', 'low'],
                        default='low', help='Minimum severity to report')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes to scan with (default: CPU count)')
     args = parser.parse_args()
     
-    # Scan files
+    # Scan files; each is independent, so they are spread across processes
     all_findings = []
-    for file_path in get_files(args.path):
-        all_findings.extend(scan_file(file_path))
+    files = get_files(args.path)
+    if args.jobs <= 1:
+        # Reads release the GIL, so threads keep the disk busy while the
+        # main thread runs the patterns
+        for file_path, content in read_ahead(files):
+            if content is not None:
+                all_findings.extend(scan_content(str(file_path), content))
+    else:
+        with Pool(args.jobs) as pool:
+            for file_findings in pool.imap_unordered(scan_file, files, chunksize=32):
+                all_findings.extend(file_findings)
     
-    # Process findings
-    findings = deduplicate_findings(all_findings)
-    findings = filter_by_severity(findings, args.severity)
-    findings.sort(key=lambda f: (['critical', 'high', 'medium', 'low'].index(f.severity), f.file, f.line))
+    # Process findings; scan_file reports each category at most once per line
+    findings, counts = filter_by_severity(all_findings, args.severity)
+    findings.sort(key=lambda f: (SEVERITY_RANK[f.severity], f.file, f.line))
     
     # Output
     if args.output == 'json':
-        print(format_json_report(findings))
+        print(format_json_report(findings, counts))
     else:
-        print(format_text_report(findings))
+        print(format_text_report(findings, counts))
     
     # Exit code
-    critical_high = sum(1 for f in findings if f.severity in ('critical', 'high'))
-    sys.exit(1 if critical_high > 0 else 0)
+    sys.exit(1 if counts['critical'] > 0 or counts['high'] > 0 else 0)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Regression tests for privacy-scan.py
+
+Each fixture is scanned once per available matching engine (stdlib re,
+RE2, Hyperscan) and must give the findings the original line-by-line
+scanner reported.
+
+Usage:
+    python scripts/test_privacy_scan.py
+"""
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).with_name('privacy-scan.py')
+
+# Optional engines each run imports; the rest are hidden from the scanner
+ENGINES = {
+    're': ('re2', 'hyperscan'),
+    're2': ('hyperscan',),
+    'hyperscan': (),
+}
+
+# name: (file contents, expected (line, category, severity, code_snippet))
+FIXTURES = {
+    'crlf.py': (
+        b'x = 1\r\npassword = 2\r\nemail = 3\r\n',
+        [
+            (2, 'pii_field', 'critical', 'password = 2'),
+            (3, 'pii_field', 'high', 'email = 3'),
+        ],
+    ),
+    'cr_only.py': (
+        b'x = 1\rpassword = 2\remail = 3\r',
+        [
+            (2, 'pii_field', 'critical', 'password = 2'),
+            (3, 'pii_field', 'high', 'email = 3'),
+        ],
+    ),
+    'non_ascii.py': (
+        (
+            "é = req.body['ssn']\n"
+            "éemail = 1\n"
+            "café_email = 1\n"
+            " email = 1\n"
+            "日本email = 1\n"
+            "—ssn = 1\n"
+            "print(émail)\n"
+            "name = 'José'; phone = 1\n"
+        ).encode(),
+        [
+            (1, 'pii_field', 'critical', "é = req.body['ssn']"),
+            (1, 'unencrypted_pii', 'critical', "é = req.body['ssn']"),
+            (4, 'pii_field', 'high', 'email = 1'),
+            (6, 'pii_field', 'critical', '—ssn = 1'),
+            (8, 'pii_field', 'high', "name = 'José'; phone = 1"),
+        ],
+    ),
+    'invalid_utf8.py': (
+        b'ssn\xff = 1\n\xff\xfe# password = 1\nx = 1 \xfe\n\xc3 email = 1\n',
+        [
+            (1, 'pii_field', 'critical', 'ssn = 1'),
+            (4, 'pii_field', 'high', 'email = 1'),
+        ],
+    ),
+    'storage.py': (
+        b'db.save(user, password)\n'
+        b'db.save(user, password)  # encrypted at rest\n'
+        b'store.put(ssn); x = encrypt\n'
+        b'console.log(email)\n'
+        b'user_ssn = req.body["ssn"]\n'
+        b'# password = 1\n'
+        b'    // ssn\n'
+        b' * credit_card\n',
+        [
+            (1, 'pii_field', 'critical', 'db.save(user, password)'),
+            (1, 'unencrypted_pii', 'critical', 'db.save(user, password)'),
+            (2, 'pii_field', 'critical', 'db.save(user, password)  # encrypted at rest'),
+            (3, 'pii_field', 'critical', 'store.put(ssn); x = encrypt'),
+            (4, 'pii_field', 'high', 'console.log(email)'),
+            (4, 'pii_in_logs', 'high', 'console.log(email)'),
+            (5, 'pii_field', 'critical', 'user_ssn = req.body["ssn"]'),
+            (5, 'unencrypted_pii', 'critical', 'user_ssn = req.body["ssn"]'),
+        ],
+    ),
+}
+
+
+def load_scanner(engine):
+    """Import privacy-scan.py with only the given engine's optional packages."""
+    if engine != 're':
+        try:
+            importlib.import_module(engine)
+        except ImportError:
+            raise unittest.SkipTest(f'{engine} is not installed')
+
+    name = f'privacy_scan_{engine}'
+    hidden = {module: sys.modules.get(module) for module in ENGINES[engine]}
+    try:
+        for module in hidden:
+            sys.modules[module] = None
+        spec = importlib.util.spec_from_file_location(name, SCRIPT)
+        scanner = importlib.util.module_from_spec(spec)
+        sys.modules[name] = scanner
+        spec.loader.exec_module(scanner)
+    finally:
+        for module, previous in hidden.items():
+            if previous is None:
+                sys.modules.pop(module, None)
+            else:
+                sys.modules[module] = previous
+    return scanner
+
+
+class ScanTestMixin:
+    ENGINE = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scanner = load_scanner(cls.ENGINE)
+
+    def scan(self, content):
+        findings = self.scanner.scan_content('fixture', content)
+        return sorted(
+            (f.line, f.category, f.severity, f.code_snippet) for f in findings
+        )
+
+    def test_engine(self):
+        self.assertEqual(self.scanner.HYPERSCAN_DB is not None, self.ENGINE == 'hyperscan')
+        if self.ENGINE != 'hyperscan':
+            self.assertEqual(self.scanner.re2.__name__, self.ENGINE)
+
+    def test_fixtures(self):
+        for name, (content, expected) in FIXTURES.items():
+            with self.subTest(fixture=name):
+                self.assertEqual(self.scan(content), sorted(expected))
+
+    def test_json_report_escapes_undecodable_file_names(self):
+        finding = self.scanner.scan_content('bad\udcff.py', b'ssn = 1\n')[0]
+        report = self.scanner.format_json_report([finding])
+        self.assertIn('"bad\\udcff.py"', report)
+
+
+class ReScanTest(ScanTestMixin, unittest.TestCase):
+    ENGINE = 're'
+
+
+class Re2ScanTest(ScanTestMixin, unittest.TestCase):
+    ENGINE = 're2'
+
+
+class HyperscanScanTest(ScanTestMixin, unittest.TestCase):
+    ENGINE = 'hyperscan'
+
+
+if __name__ == '__main__':
+    unittest.main()